@@ -13,34 +13,72 @@ Features
 * **Search CrossRef** records by free‑text query (articles, books, proceedings…).
 * **Lookup CrossRef** metadata by DOI.
 * **Lookup Open Library** metadata by ISBN.
+* **Batch lookups** of many DOIs / ISBNs fetched concurrently (threads or asyncio).
+* **On‑disk cache** of DOI / ISBN records for the CLI (default TTL 24 h, ``--no-cache``
+  to bypass). It is off for library callers (e.g. the web app), which can opt in
+  with ``configure_cache(enabled=True)``; stale entries are revalidated with conditional GETs (ETag / Last‑Modified);
+  404s are cached for 6 h (``--refresh-404`` to re‑check).
 
 Environment variables
 ---------------------
 CROSSREF_MAIL : e‑mail address inserted in the User‑Agent header for CrossRef requests.
                Defaults to "anonymous@example.com" if unset.
+CITEGUARD_CACHE_DIR : directory for the on‑disk HTTP cache.
+               Defaults to "~/.cache/citeguard/http".
 
 Examples (Version 0.5)
 ----------------------
 Search :
     python crossref_api_client.py search -q "histoire numérique" -n 3 --retries 3
+    python crossref_api_client.py search -q "deep hedging" --fields DOI,title,author
+    python crossref_api_client.py search -q "ricci flow" -n 5000 --jsonl | jq .DOI
 
 DOI :
     python crossref_api_client.py doi --doi 10.1038/s41586-024-07031-2 --timeout 45
+    python crossref_api_client.py doi --doi 10.1038/s41586-024-07031-2 --retries 8 --deadline 60
 
 ISBN :
     python crossref_api_client.py isbn --isbn 9782070368228 --retries 5
+
+Batch (one identifier per line, file or stdin) :
+    python crossref_api_client.py doi-batch --input dois.txt [--bulk]
+    cat isbns.txt | python crossref_api_client.py isbn-batch
+    python crossref_api_client.py batch --input dois_and_isbns.txt   # asyncio
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import email.utils
+import hashlib
 import json
 import os
+import random
+import string
 import sys
+import tempfile
+import threading
 import time
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import httpx
+
+try:  # optional: much faster JSON decode/encode, stdlib fallback otherwise
+    import orjson
+except ImportError:
+    orjson = None
 
-import requests
+try:  # only advertise Brotli when httpx can decode it
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, br, deflate"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -50,16 +88,43 @@ APP_VERSION = "0.5"
 DEFAULT_EMAIL = "anonymous@example.com"
 EMAIL = os.getenv("CROSSREF_MAIL", DEFAULT_EMAIL)
 USER_AGENT = f"{APP_NAME}/{APP_VERSION} (mailto:{EMAIL})"
-HEADERS = {
+# Read‑only defaults for the shared clients.  (httpx still merges these
+# into every request it builds, so this guards against mutation only.)
+HEADERS = MappingProxyType({
     "User-Agent": USER_AGENT,
     "Accept": "application/json",
-}
+    # Compressed JSON is 4–8× smaller on the wire for large search pages.
+    "Accept-Encoding": ACCEPT_ENCODING,
+})
 
 CROSSREF_BASE_URL = "https://api.crossref.org"
 OPENLIB_BASE_URL = "https://openlibrary.org/api/books"
 DEFAULT_TIMEOUT = 30  # seconds
 DEFAULT_RETRIES = 3
 BACKOFF_FACTOR = 1  # seconds (exponential: 1,2,4…)
+MAX_BACKOFF = 30  # seconds, cap on a single backoff sleep
+MAX_CONNECTIONS = 8  # HTTP/2 multiplexes many requests over each connection
+CROSSREF_PAGE_SIZE = 100  # rows per page when deep‑paging search results
+CROSSREF_BULK_SIZE = 50  # DOIs per ``filter=doi:…`` request (URL length limit)
+AIMD_INITIAL = 4  # starting per‑host concurrency of the adaptive limiter
+AIMD_MAX = 32  # ceiling for the adaptive limiter
+MAX_WORKERS = AIMD_MAX  # threads for the *_many helpers; the limiter gates them
+ASYNC_CONCURRENCY = 16  # in‑flight requests for the async batch helper
+CACHE_DIR = os.getenv("CITEGUARD_CACHE_DIR", os.path.expanduser("~/.cache/citeguard/http"))
+DEFAULT_CACHE_TTL = 86400  # seconds (24 h)
+DEFAULT_NEGATIVE_CACHE_TTL = 6 * 3600  # seconds; known‑404 DOIs are re‑checked sooner
+MEMO_SIZE = 2048  # in‑process memoised DOI / ISBN records
+
+# Shared HTTP/2 client: keep‑alive plus multiplexing, so concurrent lookups
+# share one TLS connection per host instead of one socket per request.
+_CLIENT_OPTIONS: Dict[str, Any] = dict(
+    http2=True,
+    headers=HEADERS,
+    timeout=httpx.Timeout(DEFAULT_TIMEOUT),
+    limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS),
+    follow_redirects=True,
+)
+_CLIENT = httpx.Client(**_CLIENT_OPTIONS)
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -69,69 +134,552 @@ class HTTPRequestError(SystemExit):
     """Custom exit for HTTP/network issues."""
 
 
+def _json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_text(obj: Any, indent: bool = True) -> str:
+    """JSON text (non‑ASCII kept as is), indented or compact, via orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Full‑jitter exponential delay so parallel clients do not retry in lockstep."""
+    return random.uniform(0, min(MAX_BACKOFF, BACKOFF_FACTOR * (2 ** attempt)))
+
+
+def _retry_after_seconds(resp: httpx.Response) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delta‑seconds or HTTP‑date), if any."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(int(value)))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _retry_delay(
+    exc: httpx.HTTPError,
+    *,
+    attempt: int,
+    retries: int,
+    url: str,
+    timeout: float,
+    deadline: float | None = None,
+) -> float:
+    """Seconds to wait before retrying after *exc*, or raise ``HTTPRequestError``.
+
+    Shared by the sync and async retry loops, which clip the returned delay
+    to the time left before *deadline*.
+    """
+    last = attempt >= retries - 1
+    if isinstance(exc, httpx.TimeoutException):
+        if not last:
+            return _backoff_delay(attempt)
+        raise HTTPRequestError(
+            f"[Error] Request timed out after {timeout}s (attempt {attempt + 1}/{retries}) – giving up."
+        )
+    if isinstance(exc, httpx.HTTPStatusError):
+        # 429 and 5xx can be retried; other 4xx usually not.
+        status = exc.response.status_code
+        if (status == 429 or status >= 500) and not last:
+            retry_after = (
+                _retry_after_seconds(exc.response) if status in (429, 503) else None
+            )
+            if retry_after is not None:
+                # Server told us how long to back off: honour it (plus a
+                # little jitter) rather than guessing. With a deadline the
+                # caller bounds the wait; without one (e.g. the web app's
+                # worker threads) never block longer than MAX_BACKOFF.
+                if deadline is None and retry_after > MAX_BACKOFF:
+                    raise HTTPRequestError(
+                        f"[Error] HTTP {status} {exc.response.reason_phrase} – {url} "
+                        f"(server asked to retry after {retry_after:.0f}s, over the {MAX_BACKOFF}s cap)"
+                    )
+                return retry_after + random.uniform(0, 0.5)
+            return _backoff_delay(attempt)
+        raise HTTPRequestError(
+            f"[Error] HTTP {exc.response.status_code} {exc.response.reason_phrase} – {url}"
+        )
+    if not last:
+        return _backoff_delay(attempt)
+    raise HTTPRequestError(f"[Error] Network error: {exc}")
+
+
+class AIMDLimiter:
+    """Thread‑safe concurrency limit with additive increase / multiplicative decrease.
+
+    Each 2xx/3xx response grows the limit by ``1/limit`` (≈ one slot per
+    window of successes); each 429/503 halves it. Use as a context manager
+    around a request, then report the outcome with :meth:`record`.
+    """
+
+    def __init__(self, initial: int = AIMD_INITIAL, minimum: int = 1, maximum: int = AIMD_MAX) -> None:
+        self._limit = float(initial)
+        self._minimum = minimum
+        self._maximum = maximum
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Wait for a free slot; return ``False`` if *timeout* seconds pass first."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._in_flight < int(self._limit), timeout):
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self, status: int | None = None) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+        if status is not None:
+            self.record(status)
+
+    def __enter__(self) -> AIMDLimiter:
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+    def record(self, status: int) -> None:
+        if status in (429, 503):
+            self.on_failure()
+        elif status < 400:
+            self.on_success()
+
+    def on_success(self) -> None:
+        with self._cond:
+            self._limit = min(self._maximum, self._limit + 1 / self._limit)
+            self._cond.notify_all()
+
+    def on_failure(self) -> None:
+        with self._cond:
+            self._limit = max(self._minimum, self._limit / 2)
+
+
+_LIMITERS: Dict[str, AIMDLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def _limiter_for(url: str) -> AIMDLimiter:
+    """One limiter per host: CrossRef and Open Library throttle independently."""
+    try:
+        host = httpx.URL(url).host
+    except httpx.InvalidURL as exc:
+        raise _invalid_url(exc, url)
+    with _LIMITERS_LOCK:
+        if host not in _LIMITERS:
+            _LIMITERS[host] = AIMDLimiter()
+        return _LIMITERS[host]
+
+
+_deadline: float | None = None  # time.monotonic() value, see set_deadline()
+
+
+def set_deadline(seconds: float | None) -> None:
+    """Give every following request an overall budget of *seconds* (``None`` = no limit).
+
+    Once spent, retries stop and requests fail with ``HTTPRequestError``
+    instead of backing off further.
+    """
+    global _deadline
+    _deadline = None if seconds is None else time.monotonic() + seconds
+
+
+def _remaining(deadline: float | None, url: str) -> float | None:
+    """Seconds left before *deadline*, or raise once it has passed."""
+    if deadline is None:
+        return None
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise HTTPRequestError(f"[Error] Deadline exceeded – giving up on {url}")
+    return remaining
+
+
+def _invalid_url(exc: httpx.InvalidURL, url: str) -> HTTPRequestError:
+    # httpx.InvalidURL is not an httpx.HTTPError (e.g. control characters
+    # picked up from PDF text, or an overlong DOI): report it like any
+    # other failed request instead of letting it escape as a traceback.
+    return HTTPRequestError(f"[Error] Invalid URL ({exc}) – {url!r}")
+
+
+def _check_status(resp: httpx.Response) -> httpx.Response:
+    # 304 answers a conditional GET (see _cached_get), not an error.
+    if resp.status_code != 304:
+        resp.raise_for_status()
+    return resp
+
+
 def _request_with_retries(
     *,
     method: str,
     url: str,
-    headers: Dict[str, str],
+    headers: Dict[str, str] | None = None,
     params: Dict[str, Any] | None = None,
-    timeout: int,
+    timeout: float,
     retries: int,
-) -> requests.Response:
-    """Simple exponential‑backoff retry wrapper around ``requests``."""
+    deadline: float | None = None,
+) -> httpx.Response:
+    """Exponential‑backoff (with jitter) retry wrapper around the shared client.
+
+    Calls are gated by the per‑host :class:`AIMDLimiter`. *deadline* is a
+    ``time.monotonic()`` value (default: the one from :func:`set_deadline`);
+    per‑attempt timeouts and backoff sleeps are clipped to the time left.
+    """
+    limiter = _limiter_for(url)
+    deadline = _deadline if deadline is None else deadline
     for attempt in range(retries):
+        # Queueing for a slot counts against the deadline too.
+        if not limiter.acquire(timeout=_remaining(deadline, url)):
+            raise HTTPRequestError(f"[Error] Deadline exceeded – giving up on {url}")
         try:
-            resp = requests.request(method, url, headers=headers, params=params, timeout=timeout)
-            resp.raise_for_status()
-            return resp
-        except requests.exceptions.Timeout:
-            if attempt < retries - 1:
-                time.sleep(BACKOFF_FACTOR * (2 ** attempt))
-                continue
-            raise HTTPRequestError(
-                f"[Error] Request timed out after {timeout}s (attempt {attempt + 1}/{retries}) – giving up."
+            try:
+                remaining = _remaining(deadline, url)
+                attempt_timeout = timeout if remaining is None else min(timeout, remaining)
+                resp = _CLIENT.request(method, url, headers=headers, params=params, timeout=attempt_timeout)
+            finally:
+                limiter.release()
+            limiter.record(resp.status_code)
+            return _check_status(resp)
+        except httpx.InvalidURL as exc:
+            raise _invalid_url(exc, url)
+        except httpx.HTTPError as exc:
+            delay = _retry_delay(
+                exc, attempt=attempt, retries=retries, url=url, timeout=attempt_timeout, deadline=deadline,
             )
-        except requests.exceptions.HTTPError as exc:
-            # 500/502/503 can be retried; 4xx usually not.
-            if exc.response.status_code >= 500 and attempt < retries - 1:
-                time.sleep(BACKOFF_FACTOR * (2 ** attempt))
-                continue
-            raise HTTPRequestError(
-                f"[Error] HTTP {exc.response.status_code} {exc.response.reason} – {url}"
-            )
-        except requests.exceptions.RequestException as exc:
-            if attempt < retries - 1:
-                time.sleep(BACKOFF_FACTOR * (2 ** attempt))
-                continue
-            raise HTTPRequestError(f"[Error] Network error: {exc}")
+            remaining = _remaining(deadline, url)
+            time.sleep(delay if remaining is None else min(delay, remaining))
 
     # Static analysers (e.g., Pylance) need an explicit path showing that the
     # function never returns ``None``.
     raise HTTPRequestError("[Bug] Reached end of _request_with_retries without returning.")
 
 
+async def _arequest_with_retries(
+    client: httpx.AsyncClient,
+    *,
+    method: str,
+    url: str,
+    headers: Dict[str, str] | None = None,
+    params: Dict[str, Any] | None = None,
+    timeout: float,
+    retries: int,
+    deadline: float | None = None,
+) -> httpx.Response:
+    """Async counterpart of :func:`_request_with_retries`."""
+    deadline = _deadline if deadline is None else deadline
+    for attempt in range(retries):
+        remaining = _remaining(deadline, url)
+        attempt_timeout = timeout if remaining is None else min(timeout, remaining)
+        try:
+            return _check_status(
+                await client.request(method, url, headers=headers, params=params, timeout=attempt_timeout)
+            )
+        except httpx.InvalidURL as exc:
+            raise _invalid_url(exc, url)
+        except httpx.HTTPError as exc:
+            delay = _retry_delay(
+                exc, attempt=attempt, retries=retries, url=url, timeout=attempt_timeout, deadline=deadline,
+            )
+            remaining = _remaining(deadline, url)
+            await asyncio.sleep(delay if remaining is None else min(delay, remaining))
+
+    raise HTTPRequestError("[Bug] Reached end of _arequest_with_retries without returning.")
+
+
+# ---------------------------------------------------------------------------
+# On‑disk response cache (idempotent GETs on DOI / ISBN records)
+# ---------------------------------------------------------------------------
+# One JSON file per URL+params under CACHE_DIR. The cache is best‑effort: any
+# filesystem error simply falls through to the network. 404s are cached too
+# (negative entries, shorter TTL) so malformed DOIs short‑circuit locally.
+
+_cache_enabled = False  # switched on by the CLI (main); library callers opt in
+_cache_ttl = DEFAULT_CACHE_TTL
+_negative_cache_ttl = DEFAULT_NEGATIVE_CACHE_TTL
+_refresh_negative = False
+_memo_enabled = True
+
+
+def configure_cache(
+    *,
+    enabled: bool | None = None,
+    ttl: int | None = None,
+    negative_ttl: int | None = None,
+    refresh_negative: bool | None = None,
+    memo: bool | None = None,
+) -> None:
+    """Tune the on‑disk cache and the in‑process memo.
+
+    *ttl* / *negative_ttl* are lifetimes in seconds for successful and 404
+    entries; *refresh_negative* ignores cached 404s (they are re‑fetched).
+    *memo* toggles the per‑process ``crossref_get`` / ``openlib_get`` memo,
+    whose entries never expire. Disabling either cache, turning memo off or
+    asking for *refresh_negative* clears the memo so no stale record survives.
+    """
+    global _cache_enabled, _cache_ttl, _negative_cache_ttl, _refresh_negative, _memo_enabled
+    if enabled is not None:
+        _cache_enabled = enabled
+    if ttl is not None:
+        _cache_ttl = ttl
+    if negative_ttl is not None:
+        _negative_cache_ttl = negative_ttl
+    if refresh_negative is not None:
+        _refresh_negative = refresh_negative
+    if memo is not None:
+        _memo_enabled = memo
+    if enabled is False or memo is False or refresh_negative:
+        _crossref_get_cached.cache_clear()
+        _openlib_get_cached.cache_clear()
+
+
+def _cache_path(url: str, params: Dict[str, Any] | None) -> str:
+    key = json.dumps([url, sorted((params or {}).items())], ensure_ascii=False)
+    return os.path.join(CACHE_DIR, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+
+def _cache_load(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_store(path: str, entry: Dict[str, Any]) -> None:
+    tmp = None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write to a temp file then rename, so concurrent readers never see a
+        # half‑written entry.
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(entry, fh, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+def _cache_begin(
+    url: str, params: Dict[str, Any] | None, headers: Dict[str, str] | None,
+) -> Tuple[str, Optional[Dict[str, Any]], Dict[str, str] | None]:
+    """Look *url* up in the cache; return ``(path, entry, request_headers)``.
+
+    Stale entries add ``If-None-Match`` / ``If-Modified-Since`` to the headers.
+    """
+    path = _cache_path(url, params)
+    entry = _cache_load(path) if _cache_enabled else None
+    if entry is not None and entry.get("status") == 404 and (_refresh_negative or not _cache_fresh(entry)):
+        entry = None
+    if entry is not None and not _cache_fresh(entry):
+        conditional = {}
+        if entry.get("etag"):
+            conditional["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            conditional["If-Modified-Since"] = entry["last_modified"]
+        if conditional:
+            headers = {**(headers or {}), **conditional}
+    return path, entry, headers
+
+
+def _cache_fresh(entry: Dict[str, Any]) -> bool:
+    ttl = _negative_cache_ttl if entry.get("status") == 404 else _cache_ttl
+    return time.time() - entry.get("stored_at", 0) < ttl
+
+
+def _cache_hit(entry: Dict[str, Any]) -> bytes:
+    """Body of a fresh entry; negative entries re‑raise the original 404."""
+    if entry.get("status") == 404:
+        raise HTTPRequestError(entry["error"])
+    return entry["body"].encode("utf-8")
+
+
+def _cache_failure(path: str, exc: HTTPRequestError) -> None:
+    """Remember a 404 as a negative entry; other failures are not cached."""
+    if _cache_enabled and "HTTP 404" in str(exc):
+        _cache_store(path, {"stored_at": time.time(), "status": 404, "error": str(exc)})
+
+
+def _cache_finish(path: str, entry: Optional[Dict[str, Any]], resp: httpx.Response) -> bytes:
+    """Record *resp* in the cache and return the body to hand to the caller."""
+    if resp.status_code == 304 and entry is not None:
+        entry["stored_at"] = time.time()
+        _cache_store(path, entry)
+        return entry["body"].encode("utf-8")
+    if _cache_enabled:
+        _cache_store(path, {
+            "stored_at": time.time(),
+            "status": resp.status_code,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "body": resp.text,
+        })
+    return resp.content
+
+
+def _cached_get(
+    *,
+    url: str,
+    headers: Dict[str, str] | None = None,
+    params: Dict[str, Any] | None = None,
+    timeout: int,
+    retries: int,
+) -> bytes:
+    """GET *url* through the on‑disk cache and return the raw response body.
+
+    Fresh entries are served without touching the network. Stale entries are
+    revalidated with ``If-None-Match`` / ``If-Modified-Since``; a 304 reply
+    re‑arms the entry and returns the stored body.
+    """
+    path, entry, headers = _cache_begin(url, params, headers)
+    if entry is not None and _cache_fresh(entry):
+        return _cache_hit(entry)
+    try:
+        resp = _request_with_retries(
+            method="GET",
+            url=url,
+            headers=headers,
+            params=params,
+            timeout=timeout,
+            retries=retries,
+        )
+    except HTTPRequestError as exc:
+        _cache_failure(path, exc)
+        raise
+    return _cache_finish(path, entry, resp)
+
+
+async def _acached_get(
+    client: httpx.AsyncClient,
+    *,
+    url: str,
+    headers: Dict[str, str] | None = None,
+    params: Dict[str, Any] | None = None,
+    timeout: int,
+    retries: int,
+) -> bytes:
+    """Async counterpart of :func:`_cached_get`."""
+    path, entry, headers = _cache_begin(url, params, headers)
+    if entry is not None and _cache_fresh(entry):
+        return _cache_hit(entry)
+    try:
+        resp = await _arequest_with_retries(
+            client,
+            method="GET",
+            url=url,
+            headers=headers,
+            params=params,
+            timeout=timeout,
+            retries=retries,
+        )
+    except HTTPRequestError as exc:
+        _cache_failure(path, exc)
+        raise
+    return _cache_finish(path, entry, resp)
+
+
 # ---------------------------------------------------------------------------
 # CrossRef helpers
 # ---------------------------------------------------------------------------
 
+def crossref_search_stream(
+    query: str,
+    rows: int = 20,
+    timeout: int = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    fields: List[str] | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield CrossRef works for a full‑text query, one page at a time.
+
+    Requests above ``CROSSREF_PAGE_SIZE`` rows use CrossRef deep paging
+    (``cursor=*``), so only one page is resident and *rows* may exceed the
+    1000‑row cap of a single request. *fields* restricts each record to the
+    given top‑level keys (CrossRef ``select``), e.g. ``["DOI", "title"]``.
+    """
+    params: Dict[str, Any] = {"query": query, "rows": min(rows, CROSSREF_PAGE_SIZE)}
+    if fields:
+        params["select"] = ",".join(fields)
+    if rows > CROSSREF_PAGE_SIZE:
+        params["cursor"] = "*"
+    remaining = rows
+    while remaining > 0:
+        resp = _request_with_retries(
+            method="GET",
+            url=f"{CROSSREF_BASE_URL}/works",
+            params=params,
+            timeout=timeout,
+            retries=retries,
+        )
+        message = _json_loads(resp.content).get("message", {})
+        items = message.get("items", [])[:remaining]
+        yield from items
+        remaining -= len(items)
+        next_cursor = message.get("next-cursor")
+        if not items or "cursor" not in params or not next_cursor:
+            return
+        params["cursor"] = next_cursor
+
+
 def crossref_search(
     query: str,
     rows: int = 20,
     timeout: int = DEFAULT_TIMEOUT,
     retries: int = DEFAULT_RETRIES,
+    fields: List[str] | None = None,
 ) -> List[Dict[str, Any]]:
     """Search CrossRef works via full‑text query."""
-    params = {"query": query, "rows": rows}
-    resp = _request_with_retries(
-        method="GET",
-        url=f"{CROSSREF_BASE_URL}/works",
-        headers=HEADERS,
-        params=params,
-        timeout=timeout,
-        retries=retries,
-    )
-    items = resp.json().get("message", {}).get("items", [])
-    return items
+    return list(crossref_search_stream(query, rows, timeout, retries, fields))
+
+
+_DOI_PREFIXES = ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/", "http://dx.doi.org/", "doi:")
+
+
+def _normalize_doi(doi: str) -> str:
+    """Lower‑case a DOI and strip resolver / ``doi:`` prefixes (DOIs are case‑insensitive)."""
+    doi = doi.strip().lower()
+    for prefix in _DOI_PREFIXES:
+        if doi.startswith(prefix):
+            return doi[len(prefix):]
+    return doi
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _crossref_get_cached(doi: str, timeout: int, retries: int) -> Dict[str, Any]:
+    try:
+        body = _cached_get(
+            url=f"{CROSSREF_BASE_URL}/works/{doi}",
+            timeout=timeout,
+            retries=retries,
+        )
+    except HTTPRequestError as exc:
+        # Map 404 to specific message
+        if "HTTP 404" in str(exc):
+            raise SystemExit(f"[Error] DOI not found on CrossRef: {doi}")
+        raise
+    return _json_loads(body)["message"]
 
 
 def crossref_get(
@@ -139,56 +687,278 @@ def crossref_get(
     timeout: int = DEFAULT_TIMEOUT,
     retries: int = DEFAULT_RETRIES,
 ) -> Dict[str, Any]:
-    """Retrieve one work record by DOI from CrossRef."""
+    """Retrieve one work record by DOI from CrossRef.
+
+    Results are memoised per process and the memo never expires (use
+    ``crossref_get.cache_clear()`` or ``configure_cache(memo=False)``); treat
+    the returned dict as read‑only.
+    """
+    fetch = _crossref_get_cached if _memo_enabled else _crossref_get_cached.__wrapped__
+    return fetch(_normalize_doi(doi), timeout, retries)
+
+
+crossref_get.cache_clear = _crossref_get_cached.cache_clear  # type: ignore[attr-defined]
+
+
+def _crossref_get_or_none(doi: str, timeout: int, retries: int) -> Optional[Dict[str, Any]]:
+    """:func:`crossref_get`, but ``None`` for an unknown DOI (transport errors still raise)."""
     try:
+        return crossref_get(doi, timeout, retries)
+    except HTTPRequestError:
+        raise
+    except SystemExit:  # "DOI not found"
+        return None
+
+
+def crossref_get_many(
+    dois: List[str],
+    timeout: int = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    max_workers: int = MAX_WORKERS,
+) -> List[Optional[Dict[str, Any]]]:
+    """Retrieve several DOIs concurrently; results keep the input order.
+
+    DOIs unknown to CrossRef yield ``None``; only network/HTTP failures raise.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(lambda d: _crossref_get_or_none(d, timeout, retries), dois))
+
+
+def crossref_get_bulk(
+    dois: List[str],
+    timeout: int = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    chunk_size: int = CROSSREF_BULK_SIZE,
+) -> Dict[str, Dict[str, Any]]:
+    """Retrieve many DOIs with one ``/works?filter=doi:…`` request per chunk.
+
+    Returns ``{normalised_doi: record}``; DOIs unknown to CrossRef are simply
+    absent. DOIs containing a comma cannot be expressed in a filter and are
+    fetched one by one.
+    """
+    wanted = list(dict.fromkeys(_normalize_doi(d) for d in dois))
+    records: Dict[str, Dict[str, Any]] = {}
+    batchable = [d for d in wanted if "," not in d]
+    for start in range(0, len(batchable), chunk_size):
+        chunk = batchable[start:start + chunk_size]
         resp = _request_with_retries(
             method="GET",
+            url=f"{CROSSREF_BASE_URL}/works",
+            params={"filter": ",".join(f"doi:{d}" for d in chunk), "rows": len(chunk)},
+            timeout=timeout,
+            retries=retries,
+        )
+        for item in _json_loads(resp.content).get("message", {}).get("items", []):
+            if item.get("DOI"):
+                records[item["DOI"].lower()] = item
+    for doi in wanted:
+        if "," in doi:
+            record = _crossref_get_or_none(doi, timeout, retries)
+            if record is not None:
+                records[doi] = record
+    return records
+
+# ---------------------------------------------------------------------------
+# Open Library helpers (ISBN)
+# ---------------------------------------------------------------------------
+
+# Separators seen in real ISBNs: hyphens (ASCII and Unicode), NBSP / thin
+# spaces and all ASCII whitespace (incl. the newline of a line read from a file).
+_ISBN_TRANS = str.maketrans("", "", "-\u2010\u2011\u00a0\u2009\u202f" + string.whitespace)
+
+
+def _clean_isbn(isbn: str) -> str:
+    """Drop separators and upper‑case the ``X`` check digit."""
+    return isbn.translate(_ISBN_TRANS).upper()
+
+
+def _openlib_params(isbn_clean: str) -> Dict[str, str]:
+    return {"bibkeys": f"ISBN:{isbn_clean}", "format": "json", "jscmd": "data"}
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _openlib_get_cached(isbn_clean: str, timeout: int, retries: int) -> Dict[str, Any]:
+    body = _cached_get(
+        url=OPENLIB_BASE_URL,
+        params=_openlib_params(isbn_clean),
+        timeout=timeout,
+        retries=retries,
+    )
+    data = _json_loads(body)
+    return data.get(f"ISBN:{isbn_clean}", {})
+
+
+def openlib_get(
+    isbn: str,
+    timeout: int = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+) -> Dict[str, Any]:
+    """Retrieve book metadata by ISBN via Open Library.
+
+    Results are memoised per process and the memo never expires (use
+    ``openlib_get.cache_clear()`` or ``configure_cache(memo=False)``); treat
+    the returned dict as read‑only.
+    """
+    fetch = _openlib_get_cached if _memo_enabled else _openlib_get_cached.__wrapped__
+    return fetch(_clean_isbn(isbn), timeout, retries)
+
+
+openlib_get.cache_clear = _openlib_get_cached.cache_clear  # type: ignore[attr-defined]
+
+
+def openlib_get_many(
+    isbns: List[str],
+    timeout: int = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    max_workers: int = MAX_WORKERS,
+) -> List[Optional[Dict[str, Any]]]:
+    """Retrieve several ISBNs concurrently; results keep the input order.
+
+    ISBNs unknown to Open Library yield ``None``; only network/HTTP failures raise.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(lambda i: openlib_get(i, timeout, retries) or None, isbns))
+
+# ---------------------------------------------------------------------------
+# Async helpers (one event loop for large DOI / ISBN batches)
+# ---------------------------------------------------------------------------
+
+async def crossref_aget(
+    client: httpx.AsyncClient,
+    doi: str,
+    timeout: int = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+) -> Dict[str, Any]:
+    """Async :func:`crossref_get` (shares the on‑disk cache, not the memo)."""
+    doi = _normalize_doi(doi)
+    try:
+        body = await _acached_get(
+            client,
             url=f"{CROSSREF_BASE_URL}/works/{doi}",
-            headers=HEADERS,
             timeout=timeout,
             retries=retries,
         )
     except HTTPRequestError as exc:
-        # Map 404 to specific message
         if "HTTP 404" in str(exc):
             raise SystemExit(f"[Error] DOI not found on CrossRef: {doi}")
         raise
-    return resp.json()["message"]
+    return _json_loads(body)["message"]
 
-# ---------------------------------------------------------------------------
-# Open Library helpers (ISBN)
-# ---------------------------------------------------------------------------
 
-def openlib_get(
+async def openlib_aget(
+    client: httpx.AsyncClient,
     isbn: str,
     timeout: int = DEFAULT_TIMEOUT,
     retries: int = DEFAULT_RETRIES,
 ) -> Dict[str, Any]:
-    """Retrieve book metadata by ISBN via Open Library."""
-    isbn_clean = isbn.replace("-", "").strip()
-    params = {"bibkeys": f"ISBN:{isbn_clean}", "format": "json", "jscmd": "data"}
-    resp = _request_with_retries(
-        method="GET",
+    """Async :func:`openlib_get` (shares the on‑disk cache, not the memo)."""
+    isbn_clean = _clean_isbn(isbn)
+    body = await _acached_get(
+        client,
         url=OPENLIB_BASE_URL,
-        headers={"User-Agent": USER_AGENT},
-        params=params,
+        params=_openlib_params(isbn_clean),
         timeout=timeout,
         retries=retries,
     )
-    data = resp.json()
-    return data.get(f"ISBN:{isbn_clean}", {})
+    return _json_loads(body).get(f"ISBN:{isbn_clean}", {})
+
+
+def _looks_like_doi(identifier: str) -> bool:
+    return _normalize_doi(identifier).startswith("10.")
+
+
+async def batch_aget(
+    identifiers: List[str],
+    timeout: int = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    concurrency: int = ASYNC_CONCURRENCY,
+) -> List[Optional[Dict[str, Any]]]:
+    """Fetch a mixed list of DOIs (``10.…``) and ISBNs on one event loop.
+
+    At most *concurrency* requests are in flight; results keep the input order.
+    Unknown identifiers yield ``None`` and network/HTTP failures yield
+    ``{"identifier": …, "error": …}``, so one bad entry never sinks the batch.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(**_CLIENT_OPTIONS) as client:
+        async def fetch(identifier: str) -> Optional[Dict[str, Any]]:
+            # SystemExit (incl. HTTPRequestError) must not escape a task:
+            # asyncio re‑raises it straight out of the event loop.
+            async with semaphore:
+                try:
+                    if _looks_like_doi(identifier):
+                        return await crossref_aget(client, identifier, timeout, retries)
+                    return await openlib_aget(client, identifier, timeout, retries) or None
+                except HTTPRequestError as exc:
+                    return {"identifier": identifier, "error": str(exc)}
+                except SystemExit:  # "DOI not found"
+                    return None
+
+        return list(await asyncio.gather(*(fetch(i) for i in identifiers)))
 
 # ---------------------------------------------------------------------------
 # Utilities
 # ---------------------------------------------------------------------------
 
 def pretty_print(obj: Any) -> None:
-    print(json.dumps(obj, indent=2, ensure_ascii=False))
+    """Indented JSON on a terminal, compact JSON when stdout is piped."""
+    print(_json_text(obj, indent=sys.stdout.isatty()))
+
+
+def pretty_print_stream(items: Iterable[Any]) -> int:
+    """Print *items* as a JSON array, one element at a time; return the count.
+
+    Output matches ``pretty_print(list(items))`` without building the list.
+    """
+    indent = sys.stdout.isatty()
+    count = 0
+    for item in items:
+        if indent:
+            sys.stdout.write("[\n" if count == 0 else ",\n")
+            # Only the encoder's own newlines: textwrap.indent would also split
+            # on U+2028/U+2029/U+0085 inside (unescaped) string values.
+            sys.stdout.write("  " + _json_text(item).replace("\n", "\n  "))
+        else:
+            sys.stdout.write("[" if count == 0 else ",")
+            sys.stdout.write(_json_text(item, indent=False))
+        count += 1
+    if not count:
+        sys.stdout.write("[]\n")
+    else:
+        sys.stdout.write("\n]\n" if indent else "]\n")
+    return count
+
+
+def print_jsonl(items: Iterable[Any]) -> int:
+    """Print *items* as JSON Lines (one compact object per line); return the count."""
+    count = 0
+    for item in items:
+        sys.stdout.write(_json_text(item, indent=False))
+        sys.stdout.write("\n")
+        count += 1
+    return count
+
+
+def read_identifiers(stream) -> List[str]:
+    """Read newline‑delimited identifiers, skipping blank lines."""
+    return [line.strip() for line in stream if line.strip()]
 
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
 
+def _positive_int(value: str) -> int:
+    """argparse type: an integer ≥ 1 (0 would deadlock the semaphore)."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Minimal CrossRef / Open Library client")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -197,7 +967,14 @@ def build_parser() -> argparse.ArgumentParser:
     # sub‑command (argparse pattern).
     common = argparse.ArgumentParser(add_help=False)
     common.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT, help="HTTP timeout in seconds (default: 30)")
-    common.add_argument("--retries", type=int, default=DEFAULT_RETRIES, help="Number of retries on timeout/5xx (default: 3)")
+    common.add_argument("--retries", type=int, default=DEFAULT_RETRIES, help="Number of retries on timeout/429/5xx (default: 3)")
+    common.add_argument("--no-cache", action="store_true", help="Bypass the on‑disk response cache and the in‑process memo")
+    common.add_argument("--cache-ttl", type=int, default=DEFAULT_CACHE_TTL, help="Cache lifetime in seconds (default: 86400)")
+    common.add_argument(
+        "--deadline", type=float, default=None,
+        help="Overall time budget in seconds; retries stop once it is spent (default: none)",
+    )
+    common.add_argument("--refresh-404", action="store_true", help="Ignore cached 'not found' answers and ask again")
 
     p_search = subparsers.add_parser(
         "search",
@@ -205,7 +982,24 @@ def build_parser() -> argparse.ArgumentParser:
         help="Search CrossRef works (free‑text query)",
     )
     p_search.add_argument("--query", "-q", required=True, help="Search query string")
-    p_search.add_argument("--rows", "-n", type=int, default=20, help="Number of results to return (max 1000)")
+    p_search.add_argument("--rows", "-n", type=int, default=20, help="Number of results to return (fetched in pages of 100)")
+    p_search.add_argument(
+        "--jsonl", action="store_true",
+        help="Write one JSON object per line as results arrive instead of a JSON array",
+    )
+    p_search.add_argument(
+        "--fields",
+        type=lambda s: [f.strip() for f in s.split(",") if f.strip()],
+        help=(
+            "Comma‑separated fields to return (CrossRef 'select'), e.g. DOI,title,author,issued. "
+            "Selectable: DOI, URL, title, subtitle, short-title, original-title, author, editor, "
+            "translator, chair, issued, published-print, published-online, posted, accepted, created, "
+            "deposited, indexed, container-title, short-container-title, publisher, publisher-location, "
+            "volume, issue, page, article-number, type, ISSN, issn-type, ISBN, subject, abstract, "
+            "license, link, funder, reference, references-count, is-referenced-by-count, relation, "
+            "member, prefix, score, alternative-id, archive, assertion, update-to, updated-by"
+        ),
+    )
 
     p_doi = subparsers.add_parser(
         "doi",
@@ -221,22 +1015,82 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_isbn.add_argument("--isbn", required=True, help="ISBN‑10 or ISBN‑13 of the book")
 
+    p_doi_batch = subparsers.add_parser(
+        "doi-batch",
+        parents=[common],
+        help="Get CrossRef metadata for many DOIs (one per line)",
+    )
+    p_doi_batch.add_argument(
+        "--input", "-i", type=argparse.FileType("r", encoding="utf-8"), default=sys.stdin,
+        help="File with one DOI per line (default: stdin)",
+    )
+    p_doi_batch.add_argument(
+        "--bulk", action="store_true",
+        help="Fetch up to 50 DOIs per request (filter=doi:…); prints a {doi: record} object",
+    )
+
+    p_isbn_batch = subparsers.add_parser(
+        "isbn-batch",
+        parents=[common],
+        help="Get Open Library metadata for many ISBNs (one per line)",
+    )
+    p_isbn_batch.add_argument(
+        "--input", "-i", type=argparse.FileType("r", encoding="utf-8"), default=sys.stdin,
+        help="File with one ISBN per line (default: stdin)",
+    )
+
+    p_batch = subparsers.add_parser(
+        "batch",
+        parents=[common],
+        help="Get metadata for a mixed list of DOIs and ISBNs (asyncio, one per line)",
+    )
+    p_batch.add_argument(
+        "--input", "-i", type=argparse.FileType("r", encoding="utf-8"), default=sys.stdin,
+        help="File with one DOI or ISBN per line (default: stdin)",
+    )
+    p_batch.add_argument(
+        "--concurrency", type=_positive_int, default=ASYNC_CONCURRENCY,
+        help=f"Maximum requests in flight (default: {ASYNC_CONCURRENCY})",
+    )
+
     return parser
 
 
 def main(argv: List[str] | None = None) -> None:
     parser = build_parser()
     args = parser.parse_args(argv)
+    configure_cache(
+        enabled=not args.no_cache,
+        memo=not args.no_cache,
+        ttl=args.cache_ttl,
+        refresh_negative=args.refresh_404,
+    )
+    set_deadline(args.deadline)
 
     if args.command == "search":
-        results = crossref_search(args.query, args.rows, args.timeout, args.retries)
-        if not results:
+        results = crossref_search_stream(args.query, args.rows, args.timeout, args.retries, args.fields)
+        first = next(results, None)
+        if first is None:
             raise SystemExit("[Info] No results returned – check your query.")
-        pretty_print(results)
+        if args.jsonl:
+            print_jsonl(chain([first], results))
+        else:
+            pretty_print_stream(chain([first], results))
     elif args.command == "doi":
         pretty_print(crossref_get(args.doi, args.timeout, args.retries))
     elif args.command == "isbn":
         pretty_print(openlib_get(args.isbn, args.timeout, args.retries))
+    elif args.command == "doi-batch":
+        dois = read_identifiers(args.input)
+        if args.bulk:
+            pretty_print(crossref_get_bulk(dois, args.timeout, args.retries))
+        else:
+            pretty_print(crossref_get_many(dois, args.timeout, args.retries))
+    elif args.command == "isbn-batch":
+        pretty_print(openlib_get_many(read_identifiers(args.input), args.timeout, args.retries))
+    elif args.command == "batch":
+        identifiers = read_identifiers(args.input)
+        pretty_print(asyncio.run(batch_aget(identifiers, args.timeout, args.retries, args.concurrency)))
     else:
         parser.error("Unknown command")
 
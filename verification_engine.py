@@ -682,7 +682,7 @@ def _verify_by_crossref_search(citation: Citation) -> VerificationResult:
         return VerificationResult.from_citation(citation, "not_found", 0, _NOT_FOUND)
 
     try:
-        items = crossref_search(query, rows=5, timeout=15, retries=2)
+        items = crossref_search(query, rows=5, timeout=15, retries=2, fields=["DOI", "title", "author"])
     except (HTTPRequestError, SystemExit):
         return VerificationResult.from_citation(citation, "not_found", 0, _NOT_FOUND)
 